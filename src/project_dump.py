@@ -23,13 +23,28 @@ import argparse
 import fnmatch
 import json
 import os
-import subprocess
+import re
 import sys
-import tkinter as tk
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from tkinter import filedialog, messagebox, ttk
-from tkinter.scrolledtext import ScrolledText
-from typing import List, Optional, Set
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 # Constants
 EXCLUDE_DIRS: Set[str] = {"node_modules", ".git", "__pycache__"}
@@ -44,35 +59,70 @@ Based on the following code, please answer the question or perform the task as i
 # code
 """
 PROMPT_FILE = "custom_prompt.json"
+# POSIX bracket expressions supported in .gitignore sets, as regex class bodies
+POSIX_CHAR_CLASSES: Dict[str, str] = {
+    "alnum": "a-zA-Z0-9",
+    "alpha": "a-zA-Z",
+    "blank": r" \t",
+    "cntrl": r"\x00-\x1f\x7f",
+    "digit": "0-9",
+    "graph": "!-~",
+    "lower": "a-z",
+    "print": " -~",
+    "punct": r"!-/:-@\[-`{-~",
+    "space": r"\s",
+    "upper": "A-Z",
+    "xdigit": "0-9A-Fa-f",
+}
+# fnmatch.fnmatch is case-insensitive wherever os.path.normcase folds case
+PATTERN_FLAGS: int = re.IGNORECASE if os.path.normcase("A") == "a" else 0
 BINARY_CHECK_BYTES = 1024
-
-# TkDnD Availability
+BINARY_SNIFF_BYTES = 4096
+# Printable ASCII (space to tilde) plus tab, line feed and carriage return
+TEXT_BYTES: bytes = bytes([9, 10, 13, *range(32, 127)])
+# Extensions that decide binary/text without sniffing the file contents
+# fmt: off
+BINARY_EXTENSIONS: FrozenSet[str] = frozenset(
+    {
+        ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp", ".tif", ".tiff",
+        ".pdf", ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar", ".tar",
+        ".exe", ".dll", ".so", ".dylib", ".a", ".lib", ".o", ".obj", ".bin",
+        ".class", ".jar", ".war", ".pyc", ".pyd", ".whl", ".wasm",
+        ".mp3", ".mp4", ".wav", ".ogg", ".flac", ".avi", ".mov", ".mkv", ".webm",
+        ".ttf", ".otf", ".woff", ".woff2", ".eot",
+        ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
+        ".db", ".sqlite", ".sqlite3", ".pkl", ".npy", ".npz",
+    }
+)
+TEXT_EXTENSIONS: FrozenSet[str] = frozenset(
+    {
+        ".py", ".pyi", ".pyx", ".ipynb", ".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx",
+        ".vue", ".svelte", ".md", ".markdown", ".rst", ".txt", ".tex",
+        ".json", ".jsonc", ".json5", ".yaml", ".yml", ".toml", ".ini", ".cfg",
+        ".conf", ".properties", ".lock",
+        ".html", ".htm", ".css", ".scss", ".sass", ".less", ".xml", ".svg",
+        ".csv", ".tsv", ".sql", ".graphql", ".proto",
+        ".sh", ".bash", ".zsh", ".fish", ".bat", ".cmd", ".ps1",
+        ".c", ".h", ".cpp", ".hpp", ".cc", ".hh", ".cxx", ".m", ".mm",
+        ".cs", ".fs", ".java", ".kt", ".kts", ".scala", ".groovy", ".gradle",
+        ".go", ".rs", ".rb", ".php", ".pl", ".swift", ".dart", ".lua", ".r", ".jl",
+        ".ex", ".exs", ".erl", ".hs", ".clj", ".elm", ".zig", ".nim",
+        ".tf", ".hcl", ".cmake", ".mk",
+    }
+)
+# fmt: on
+READ_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
+READ_AHEAD: int = READ_WORKERS * 2
+# Projects with at least this many files are read in worker processes
+PROCESS_POOL_MIN_FILES: int = 20000
+PROCESS_BATCH_SIZE: int = 256
+# Counted in batches, so it scales with the pool size rather than READ_WORKERS
+PROCESS_READ_AHEAD: int = 2 * (os.cpu_count() or 1)
+
+# TkDnD Availability (set by _import_gui)
 TKDND_AVAILABLE: bool = False
 DND_FILES: str = "dummy"  # Default value if TkDnD is not available
 
-try:
-    from tkinterdnd2 import DND_FILES, TkinterDnD
-
-    TKDND_AVAILABLE = True
-except ImportError:
-    print("TkinterDnD2 is not installed. Installing it with pip...")
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "tkinterdnd2"])
-        from tkinterdnd2 import DND_FILES, TkinterDnD
-
-        print("TkinterDnD2 has been installed successfully.")
-        TKDND_AVAILABLE = True
-    except Exception as e:
-        print(f"Error installing TkinterDnD2: {e}")
-        print("Please install it manually using: pip install tkinterdnd2")
-        print("Drag and drop functionality will be disabled.")
-
-        class TkinterDnD:
-            @staticmethod
-            def Tk() -> tk.Tk:
-                """Create a basic Tk window when TkinterDnD is not available."""
-                return tk.Tk()
-
 
 class ProjectDumper:
     """
@@ -87,109 +137,376 @@ class ProjectDumper:
         """
         Initialize the ProjectDumper with exclusion rules.
         """
-        self.exclude_dirs = exclude_dirs if exclude_dirs is not None else EXCLUDE_DIRS
-        self.exclude_file_patterns = (
+        self.exclude_dirs: FrozenSet[str] = frozenset(
+            exclude_dirs if exclude_dirs is not None else EXCLUDE_DIRS
+        )
+        self.exclude_file_patterns: FrozenSet[str] = frozenset(
             exclude_file_patterns
             if exclude_file_patterns is not None
             else EXCLUDE_FILE_PATTERNS
         )
+        # Compiled once here; only .gitignore rules are compiled per project.
+        self._exclude_re: Optional[re.Pattern[str]] = (
+            re.compile(
+                "|".join(
+                    f"(?:{fnmatch.translate(p)})"
+                    for p in sorted(self.exclude_file_patterns)
+                ),
+                PATTERN_FLAGS,
+            )
+            if self.exclude_file_patterns
+            else None
+        )
 
     def process_project(self, src: Path, prompt: str) -> str:
         """
         Process project directory into a single text output.
         """
+        return "\n\n".join(self.iter_project_chunks(src, prompt))
+
+    def iter_project_chunks(self, src: Path, prompt: str) -> Iterator[str]:
+        """
+        Yield the output of process_project piece by piece.
+
+        Joining the chunks with blank lines ("\\n\\n") gives the full output, so
+        callers can stream it without holding the whole dump in memory.
+        """
         gitignore_patterns = self._load_gitignore(src)
-        tree_lines = [src.name]
-        tree_lines += self._generate_tree_lines(
-            src, gitignore_patterns=gitignore_patterns
-        )
-        files = self._collect_files(src, gitignore_patterns)
+        self._compile_gitignore(gitignore_patterns)
+        tree_lines, files = self._walk_once(src)
+        # Walked paths all start with this, so relative paths are a plain slice.
+        src_prefix = os.path.join(str(src), "")
+
+        yield from [
+            prompt.strip(),
+            "",
+            "## Project Structure",
+            "\n".join(tree_lines),
+            "",
+        ]
+
+        if len(files) >= PROCESS_POOL_MIN_FILES and (os.cpu_count() or 1) > 1:
+            # Very large projects: spread the per-file Python work (sniffing,
+            # decoding, formatting) over processes, in batches to amortize
+            # pickling. DirEntry cannot be pickled, so workers get plain paths.
+            from concurrent.futures import ProcessPoolExecutor
+
+            batches = [
+                [entry.path for entry in files[i : i + PROCESS_BATCH_SIZE]]
+                for i in range(0, len(files), PROCESS_BATCH_SIZE)
+            ]
+            with ProcessPoolExecutor() as executor:
+                # A static method, so only the prefix and paths are pickled.
+                read_batch = partial(ProjectDumper._read_batch, src_prefix)
+                batches_read = self._map_ahead(
+                    executor, read_batch, batches, PROCESS_READ_AHEAD
+                )
+                for batch in batches_read:
+                    for parts in batch:
+                        yield from parts
+        else:
+            # Reads are I/O-bound and release the GIL, so threads overlap them.
+            with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+                read_entry = partial(self._read_entry, src_prefix)
+                for parts in self._map_ahead(executor, read_entry, files, READ_AHEAD):
+                    yield from parts
+
+    def _map_ahead(
+        self,
+        executor: Executor,
+        fn: Callable[[T], R],
+        items: List[T],
+        window: int,
+    ) -> Iterator[R]:
+        """
+        Like executor.map, but only `window` calls run ahead of the consumer.
 
-        result = [prompt.strip(), "", "## Project Structure", "\n".join(tree_lines), ""]
+        Results are yielded in order without buffering every finished call.
+        """
+        pending: Deque[Future[R]] = deque()
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def _read_entry(self, src_prefix: str, entry: os.DirEntry[str]) -> List[str]:
+        """
+        Read a file found by the walk, using the DirEntry's cached stat.
+        """
+        # DirEntry caches its stat result (on Windows it comes free with readdir).
+        return self._read_file(src_prefix, entry.path, entry.stat().st_size)
 
-        for path in files:
-            relative_path = str(path.relative_to(src)).replace("\\", "/")
+    @staticmethod
+    def _read_batch(src_prefix: str, paths: List[str]) -> List[List[str]]:
+        """
+        Read a batch of files in a worker process.
+        """
+        return [
+            ProjectDumper._read_file(src_prefix, path, os.stat(path).st_size)
+            for path in paths
+        ]
 
-            file_size_mb = path.stat().st_size / (1024 * 1024)
-            if file_size_mb > 5:  # skip >5MB
-                print(f"Skipping large file: {relative_path} ({file_size_mb:.2f} MB)")
-                result.append(f"# [Skipped large file] File: {relative_path}")
-                continue
+    @staticmethod
+    def _read_file(src_prefix: str, file_path: str, size: int) -> List[str]:
+        """
+        Read a single file into output parts (header and content).
 
-            if self._is_binary(path):
-                continue
+        Returns an empty list for binary files, which are left out of the dump.
+        """
+        relative_path = file_path[len(src_prefix) :]
+        if os.sep != "/":
+            relative_path = relative_path.replace(os.sep, "/")
 
-            result.append(f"# ===== File: {relative_path} =====")
-            try:
-                result.append(path.read_text(encoding="utf-8"))
-            except Exception as e:
-                result.append(f"# [Error reading file: {e}]")
-        return "\n\n".join(result)
+        file_size_mb = size / (1024 * 1024)
+        if file_size_mb > 5:  # skip >5MB
+            print(
+                f"Skipping large file: {relative_path} ({file_size_mb:.2f} MB)",
+                file=sys.stderr,
+            )
+            return [f"# [Skipped large file] File: {relative_path}"]
+
+        # Known extensions skip the content sniff: binaries are never opened.
+        suffix = os.path.splitext(file_path)[1].lower()
+        if suffix in BINARY_EXTENSIONS:
+            return []
+        sniff = suffix not in TEXT_EXTENSIONS
+
+        # Read once: the binary check runs on the head of the same buffer that
+        # is decoded for the dump.
+        try:
+            data = ProjectDumper._slurp(file_path, size)
+        except Exception:
+            return []  # Consider it binary if there's an error reading it
+
+        if sniff and ProjectDumper._is_binary_bytes(data[:BINARY_SNIFF_BYTES]):
+            return []
+
+        try:
+            content = data.decode("utf-8")
+        except Exception as e:
+            content = f"# [Error reading file: {e}]"
+        else:
+            if "\r" in content:  # Universal newlines, as Path.read_text applies
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return [f"# ===== File: {relative_path} =====", content]
 
-    def _load_gitignore(self, src: Path) -> Set[str]:
+    @staticmethod
+    def _slurp(path: str, size: int) -> bytes:
         """
-        Load .gitignore patterns from the project root.
+        Read a file of known size with a single os.read in the common case.
+
+        Skips the buffered-IO layer of Path.read_bytes, which stats the file
+        again and reads in chunks.
+        """
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            chunks: List[bytes] = []
+            remaining = size
+            while remaining > 0:  # os.read may return short on some filesystems
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            return b"".join(chunks)
+        finally:
+            os.close(fd)
+
+    def _load_gitignore(self, src: Path) -> List[str]:
         """
-        patterns = set()
+        Load .gitignore patterns from the project root, in file order.
+        """
+        patterns: List[str] = []
         gitignore = src / ".gitignore"
         if gitignore.is_file():
             for line in gitignore.read_text(encoding="utf-8").splitlines():
                 line = line.strip()
                 if line and not line.startswith("#"):
-                    patterns.add(line)
+                    patterns.append(line)
         return patterns
 
-    def _should_exclude(self, name: str, gitignore_patterns: Set[str]) -> bool:
+    def _compile_gitignore(self, gitignore_patterns: List[str]) -> None:
         """
-        Check whether a file or directory should be excluded based on patterns.
+        Compile .gitignore rules into a single regex for _should_exclude.
         """
-        patterns = self.exclude_file_patterns.union(gitignore_patterns)
-        return (
-            any(fnmatch.fnmatch(name, pat) for pat in patterns)
-            or name in self.exclude_dirs
+        # Each .gitignore rule becomes a named group ("i" = ignore, "n" = negated
+        # with "!"). Rules are joined in reverse so the first alternative that
+        # matches is the last matching rule in the file, as git resolves them.
+        groups = []
+        for index, pattern in enumerate(gitignore_patterns):
+            kind = "i"
+            if pattern.startswith("!"):
+                kind, pattern = "n", pattern[1:]
+            regex = self._translate_gitignore_pattern(pattern)
+            if regex is None:
+                continue
+            try:
+                re.compile(regex, PATTERN_FLAGS)
+            except re.error:
+                continue  # Skip malformed rules, as git does
+            groups.append(f"(?P<{kind}{index}>{regex})")
+        self._gitignore_re: Optional[re.Pattern[str]] = (
+            re.compile("|".join(reversed(groups)), PATTERN_FLAGS) if groups else None
         )
 
-    def _generate_tree_lines(
-        self, dir_path: Path, prefix: str = "", gitignore_patterns: Set[str] = set()
-    ) -> List[str]:
+    def _translate_gitignore_pattern(self, pattern: str) -> Optional[str]:
         """
-        Generate tree structure lines of the project.
+        Translate a .gitignore pattern into a regex over project-relative paths.
+
+        Paths are POSIX-style and directories carry a trailing slash.
         """
-        lines: List[str] = []
-        entries = sorted(
-            [
-                p
-                for p in dir_path.iterdir()
-                if not self._should_exclude(p.name, gitignore_patterns)
-            ],
-            key=lambda p: (not p.is_dir(), p.name.lower()),
-        )
-        pointers = ["├── "] * (len(entries) - 1) + ["└── "] if entries else []
-        for pointer, path in zip(pointers, entries):
-            lines.append(f"{prefix}{pointer}{path.name}")
-            if path.is_dir():
-                extension = "│   " if pointer == "├── " else "    "
-                lines += self._generate_tree_lines(
-                    path, prefix + extension, gitignore_patterns
-                )
-        return lines
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        if not pattern:
+            return None
+        # A slash anywhere but the end anchors the pattern to the project root.
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+
+        parts: List[str] = [] if anchored else ["(?:.*/)?"]
+        i, n = 0, len(pattern)
+        while i < n:
+            c = pattern[i]
+            at_segment_start = i == 0 or pattern[i - 1] == "/"
+            if at_segment_start and pattern.startswith("**/", i):
+                parts.append("(?:.*/)?")
+                i += 3
+                continue
+            if at_segment_start and pattern.startswith("**", i) and i + 2 == n:
+                parts.append(".+")
+                break
+            if c == "*":
+                parts.append("[^/]*")
+            elif c == "?":
+                parts.append("[^/]")
+            elif c == "[":
+                # Find the closing "]" as fnmatch.translate does: a leading
+                # "!"/"^" and a "]" right after it belong to the set, and
+                # "[:class:]" forms are skipped over whole.
+                j = i + 1
+                if j < n and pattern[j] in "!^":
+                    j += 1
+                if j < n and pattern[j] == "]":
+                    j += 1
+                while j < n and pattern[j] != "]":
+                    if pattern.startswith("[:", j) and pattern.find(":]", j + 2) != -1:
+                        j = pattern.find(":]", j + 2) + 2
+                    else:
+                        j += 1
+                if j >= n:
+                    parts.append(re.escape(c))
+                else:
+                    char_class = self._translate_char_class(pattern[i + 1 : j])
+                    if char_class is None:
+                        return None
+                    parts.append(char_class)
+                    i = j
+            elif c == "\\" and i + 1 < n:
+                i += 1
+                parts.append(re.escape(pattern[i]))
+            else:
+                parts.append(re.escape(c))
+            i += 1
+        parts.append("/" if dir_only else "/?")
+        return "".join(parts) + r"\Z"
+
+    def _translate_char_class(self, body: str) -> Optional[str]:
+        """
+        Translate the inside of a .gitignore "[...]" set into a regex class.
 
-    def _collect_files(
-        self, dir_path: Path, gitignore_patterns: Set[str]
-    ) -> List[Path]:
+        Returns None for an unknown "[:class:]" name, which makes the rule
+        malformed.
         """
-        Collect all file paths to be included in the output.
+        negate = body[:1] in ("!", "^")
+        if negate:
+            body = body[1:]
+        parts: List[str] = ["[^" if negate else "["]
+        for token in re.split(r"(\[:[a-z]+:\])", body):
+            if token.startswith("[:") and token.endswith(":]"):
+                posix_class = POSIX_CHAR_CLASSES.get(token[2:-2])
+                if posix_class is None:
+                    return None
+                parts.append(posix_class)
+            else:
+                # Escape everything but "-" so ranges keep working and no
+                # character (backslash, [, &, ~, |) has a special meaning in the set.
+                parts.extend(ch if ch == "-" else re.escape(ch) for ch in token)
+        parts.append("]")
+        return "".join(parts)
+
+    def _should_exclude(self, entry: os.DirEntry[str], rel_dir: str) -> bool:
         """
-        files: List[Path] = []
-        for root, dirs, filenames in os.walk(dir_path):
-            root_path = Path(root)
-            dirs[:] = [
-                d for d in dirs if not self._should_exclude(d, gitignore_patterns)
-            ]
-            for fname in filenames:
-                if not self._should_exclude(fname, gitignore_patterns):
-                    files.append(root_path / fname)
-        return files
+        Check whether a file or directory should be excluded based on patterns.
+
+        Cheapest checks run first; the relative path is only built when there
+        are .gitignore rules to match it against.
+        """
+        name = entry.name
+        if name in self.exclude_dirs:
+            return True
+        if self._exclude_re is not None and self._exclude_re.match(name) is not None:
+            return True
+        if self._gitignore_re is None:
+            return False
+        rel_path = f"{rel_dir}{name}/" if entry.is_dir() else f"{rel_dir}{name}"
+        match = self._gitignore_re.match(rel_path)
+        return match is not None and match.lastgroup[0] == "i"
+
+    def _walk_once(self, src: Path) -> Tuple[List[str], List[os.DirEntry[str]]]:
+        """
+        Walk the project once, generating tree lines and collecting file entries.
+        """
+        tree_lines = [src.name]
+        files: List[os.DirEntry[str]] = []
+        # Depth-first with an explicit stack instead of recursion. Each item is
+        # (entry, relative dir, line prefix, child prefix); children are pushed
+        # in reverse so they pop in sorted order, giving the tree's pre-order.
+        stack: List[Tuple[os.DirEntry[str], str, str, str]] = []
+        self._push_children(stack, str(src), "", "")
+        while stack:
+            entry, rel_dir, line_prefix, child_prefix = stack.pop()
+            tree_lines.append(line_prefix + entry.name)
+            if entry.is_dir():
+                # Like os.walk, list symlinked directories but do not descend, so
+                # a link back up the tree cannot make the walk loop forever.
+                if not entry.is_symlink():
+                    self._push_children(
+                        stack, entry.path, f"{rel_dir}{entry.name}/", child_prefix
+                    )
+            else:
+                files.append(entry)
+        return tree_lines, files
+
+    def _push_children(
+        self,
+        stack: List[Tuple[os.DirEntry[str], str, str, str]],
+        dir_path: str,
+        rel_dir: str,
+        prefix: str,
+    ) -> None:
+        """
+        Scan a directory and push its non-excluded entries onto the walk stack.
+
+        Excluded directories are pruned here, so their contents are never read.
+        """
+        # Scanned by path rather than with os.fwalk/dir_fd: files are read later
+        # by the reader threads, after this directory's fd would be closed.
+        with os.scandir(dir_path) as it:
+            entries = [e for e in it if not self._should_exclude(e, rel_dir)]
+        # DirEntry caches the file type reported by readdir, so these is_dir()
+        # calls do not stat again (except for symlinks).
+        entries.sort(key=lambda e: (not e.is_dir(), e.name.lower()))
+        if not entries:
+            return
+        # The prefixes are built once per directory and shared by its children,
+        # rather than concatenated again for every entry.
+        branch, child_prefix = f"{prefix}├── ", f"{prefix}│   "
+        # Pushed last-to-first so the stack pops them in sorted order.
+        stack.append((entries[-1], rel_dir, f"{prefix}└── ", f"{prefix}    "))
+        for i in range(len(entries) - 2, -1, -1):
+            stack.append((entries[i], rel_dir, branch, child_prefix))
 
     # def _is_binary(self, path: Path) -> bool:
     #     """
@@ -202,46 +519,41 @@ class ProjectDumper:
     #     except Exception:
     # return True  # Consider it binary if there's an error reading it
 
-    def _is_binary(self, path: Path, check_bytes: int = 4096) -> bool:
+    @staticmethod
+    def _is_binary_bytes(chunk: bytes) -> bool:
         """
-        Detect if a file is binary using more robust heuristics.
+        Detect if the leading bytes of a file are binary using robust heuristics.
         """
-        try:
-            with path.open("rb") as f:
-                chunk = f.read(check_bytes)
-        except Exception:
-            return True  # Consider it binary if there's an error reading it
-
         if b"\0" in chunk:
             return True  # Null byte found, likely binary
 
         # Check for a high frequency of non-printable characters (excluding common ones)
+        # Deleting the text bytes leaves only the non-printable ones, in one C pass.
         non_printable_threshold = 0.1  # If > 10% are non-printable, consider binary
-        non_printable_count = 0
-        printable_ascii = set(range(32, 127))  # Space to tilde
-        common_control = {9, 10, 13}  # Tab, Line Feed, Carriage Return
-
-        for byte in chunk:
-            if byte not in printable_ascii and byte not in common_control:
-                non_printable_count += 1
-
+        non_printable_count = len(chunk.translate(None, TEXT_BYTES))
         if chunk and non_printable_count / len(chunk) > non_printable_threshold:
             return True
 
-        # Check for unusual byte patterns (e.g., high byte values in text files)
-        high_byte_threshold = 0.8  # If > 80% have the high bit set, might be binary
-        high_byte_count = 0
-        for byte in chunk:
-            if byte > 127:
-                high_byte_count += 1
-
-        if chunk and high_byte_count / len(chunk) > high_byte_threshold:
-            return True
+        # High bytes (> 127) already count as non-printable, so a separate
+        # high-bit frequency check could never trigger past this point.
 
         # If none of the binary indicators are strong, assume it's text
         return False
 
 
+def _json_loads(data: bytes) -> Any:
+    """
+    Parse JSON with orjson when installed, otherwise the standard library.
+
+    Imported on first use, so start-up does not pay for it.
+    """
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    return loads(data)
+
+
 class PromptManager:
     """
     Manages loading and saving the custom prompt.
@@ -251,12 +563,12 @@ class PromptManager:
         """
         Load the custom prompt from a file, if it exists.
         """
-        if Path(PROMPT_FILE).exists():
-            try:
-                with open(PROMPT_FILE, "r", encoding="utf-8") as f:
-                    return json.load(f).get("custom_prompt")
-            except Exception as e:
-                print(f"Error loading custom prompt: {e}")
+        try:
+            return _json_loads(Path(PROMPT_FILE).read_bytes()).get("custom_prompt")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading custom prompt: {e}")
         return None
 
     def save_custom_prompt(self, prompt: str) -> None:
@@ -270,304 +582,347 @@ class PromptManager:
             print(f"Error saving custom prompt: {e}")
 
 
-class App(TkinterDnD.Tk):
+def _import_gui() -> None:
     """
-    Main GUI Application for project dump tool.
+    Import tkinter and the optional TkinterDnD2 into module globals.
+
+    Deferred until the GUI starts, so CLI runs never load the GUI toolkit.
     """
+    global tk, ttk, filedialog, messagebox, ScrolledText
+    global DND_FILES, TkinterDnD, TKDND_AVAILABLE
 
-    def __init__(self) -> None:
-        """Initialize the application and set up the UI."""
-        super().__init__()
-        self.title("Project Dump Tool")
-        self.geometry("900x700")
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, ttk
+    from tkinter.scrolledtext import ScrolledText
 
-        self.style = ttk.Style()
-        try:
-            self.style.theme_use("clam")  # Use a modern looking theme
-        except tk.TclError:
-            pass
+    try:
+        from tkinterdnd2 import DND_FILES, TkinterDnD
 
-        self.style.configure("TButton", font=("Helvetica", 10))
-        self.style.configure("TLabel", font=("Helvetica", 11))
-        self.style.configure("Header.TLabel", font=("Helvetica", 12, "bold"))
+        TKDND_AVAILABLE = True
+    except ImportError:
+        # Drag and drop is optional; run_gui_mode tells the user how to enable it.
+        class TkinterDnD:
+            """Fallback exposing a basic Tk window when TkinterDnD is not available."""
 
-        self.prompt_manager = PromptManager()
-        self.custom_prompt = self.prompt_manager.load_custom_prompt() or DEFAULT_PROMPT
-        self.project_dumper = ProjectDumper()
+            Tk = tk.Tk
 
-        self.status_var = tk.StringVar(value="Ready")
-        self.generated_output = ""
-        self.folder_path_var = tk.StringVar()
-        self.excluded_dirs_var = tk.StringVar(value=", ".join(EXCLUDE_DIRS))
-        self.excluded_patterns_var = tk.StringVar(
-            value=", ".join(EXCLUDE_FILE_PATTERNS)
-        )
 
-        self.setup_ui()
+def _build_app_class() -> type:
+    """
+    Define the GUI application class once the GUI modules are imported.
+    """
+    _import_gui()
 
-    def setup_ui(self) -> None:
+    class App(TkinterDnD.Tk):
         """
-        Set up the main user interface with improved layout.
+        Main GUI Application for project dump tool.
         """
-        main_container = ttk.Frame(self, padding="10")
-        main_container.pack(fill=tk.BOTH, expand=True)
 
-        action_frame = ttk.Frame(main_container)
-        action_frame.pack(fill=tk.X, pady=(0, 10))
+        def __init__(self) -> None:
+            """Initialize the application and set up the UI."""
+            super().__init__()
+            self.title("Project Dump Tool")
+            self.geometry("900x700")
 
-        project_frame = ttk.LabelFrame(action_frame, text="Project", padding="5")
-        project_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            self.style = ttk.Style()
+            try:
+                self.style.theme_use("clam")  # Use a modern looking theme
+            except tk.TclError:
+                pass
 
-        folder_entry = ttk.Entry(
-            project_frame, textvariable=self.folder_path_var, width=40
-        )
-        folder_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        if TKDND_AVAILABLE:
-            folder_entry.drop_target_register(DND_FILES)
-            folder_entry.dnd_bind("<<Drop>>", self._on_drop_folder)
+            self.style.configure("TButton", font=("Helvetica", 10))
+            self.style.configure("TLabel", font=("Helvetica", 11))
+            self.style.configure("Header.TLabel", font=("Helvetica", 12, "bold"))
 
-        btn_select = ttk.Button(
-            project_frame, text="Browse...", command=self._select_folder
-        )
-        btn_select.pack(side=tk.LEFT)
+            self.prompt_manager = PromptManager()
+            self.custom_prompt = (
+                self.prompt_manager.load_custom_prompt() or DEFAULT_PROMPT
+            )
+            self.project_dumper = ProjectDumper()
+
+            self.status_var = tk.StringVar(value="Ready")
+            self.generated_output = ""
+            self.folder_path_var = tk.StringVar()
+            self.excluded_dirs_var = tk.StringVar(value=", ".join(EXCLUDE_DIRS))
+            self.excluded_patterns_var = tk.StringVar(
+                value=", ".join(EXCLUDE_FILE_PATTERNS)
+            )
 
-        dnd_hint = ttk.Label(
-            project_frame,
-            text="✓ Drag & Drop Enabled",
-            foreground="green" if TKDND_AVAILABLE else "gray",
-        )
-        dnd_hint.pack(side=tk.LEFT, padx=(5, 0))
+            self.setup_ui()
 
-        buttons_frame = ttk.Frame(action_frame)
-        buttons_frame.pack(side=tk.RIGHT, padx=(10, 0))
+        def setup_ui(self) -> None:
+            """
+            Set up the main user interface with improved layout.
+            """
+            # Child widgets need no registration of their own: tkdnd resolves a
+            # drop to the nearest registered ancestor, here the root window.
+            if TKDND_AVAILABLE:
+                self.drop_target_register(DND_FILES)
+                self.dnd_bind("<<Drop>>", self._on_drop_folder)
 
-        btn_copy = ttk.Button(
-            buttons_frame, text="Copy to Clipboard", command=self._copy_to_clipboard
-        )
-        btn_copy.pack(side=tk.LEFT, padx=(0, 5))
+            main_container = ttk.Frame(self, padding="10")
+            main_container.pack(fill=tk.BOTH, expand=True)
 
-        btn_save = ttk.Button(
-            buttons_frame, text="Save to File", command=self._save_to_file
-        )
-        btn_save.pack(side=tk.LEFT)
-
-        notebook = ttk.Notebook(main_container)
-        notebook.pack(fill=tk.BOTH, expand=True)
-
-        output_frame = ttk.Frame(notebook, padding="5")
-        notebook.add(output_frame, text="Output")
-
-        drop_frame = ttk.Frame(output_frame, padding="2")
-        drop_frame.pack(fill=tk.BOTH, expand=True)
-        if TKDND_AVAILABLE:
-            drop_frame.drop_target_register(DND_FILES)
-            drop_frame.dnd_bind("<<Drop>>", self._on_drop_folder)
-            self.drop_target_register(DND_FILES)
-            self.dnd_bind("<<Drop>>", self._on_drop_folder)
-
-        output_label = ttk.Label(
-            drop_frame,
-            text="Generated Project Dump: (Drag & Drop folder here)",
-            style="Header.TLabel",
-        )
-        output_label.pack(anchor=tk.W, pady=(0, 5))
-        if TKDND_AVAILABLE:
-            output_label.drop_target_register(DND_FILES)
-            output_label.dnd_bind("<<Drop>>", self._on_drop_folder)
-
-        self.text_area = ScrolledText(drop_frame, wrap=tk.WORD, font=("Consolas", 10))
-        self.text_area.pack(expand=True, fill=tk.BOTH)
-        if TKDND_AVAILABLE:
-            self.text_area.drop_target_register(DND_FILES)
-            self.text_area.dnd_bind("<<Drop>>", self._on_drop_folder)
-
-        prompt_frame = ttk.Frame(notebook, padding="5")
-        notebook.add(prompt_frame, text="Custom Prompt")
-
-        prompt_label = ttk.Label(
-            prompt_frame, text="Enter your custom AI prompt:", style="Header.TLabel"
-        )
-        prompt_label.pack(anchor=tk.W, pady=(0, 5))
+            action_frame = ttk.Frame(main_container)
+            action_frame.pack(fill=tk.X, pady=(0, 10))
 
-        self.custom_prompt_text = ScrolledText(
-            prompt_frame, height=10, font=("Consolas", 10)
-        )
-        self.custom_prompt_text.insert(tk.END, self.custom_prompt)
-        self.custom_prompt_text.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+            project_frame = ttk.LabelFrame(action_frame, text="Project", padding="5")
+            project_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
-        prompt_buttons_frame = ttk.Frame(prompt_frame)
-        prompt_buttons_frame.pack(fill=tk.X)
+            folder_entry = ttk.Entry(
+                project_frame, textvariable=self.folder_path_var, width=40
+            )
+            folder_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
 
-        btn_save_custom = ttk.Button(
-            prompt_buttons_frame,
-            text="Save Custom Prompt",
-            command=self._save_custom_prompt,
-        )
-        btn_save_custom.pack(side=tk.LEFT, padx=(0, 5))
+            btn_select = ttk.Button(
+                project_frame, text="Browse...", command=self._select_folder
+            )
+            btn_select.pack(side=tk.LEFT)
 
-        btn_reset = ttk.Button(
-            prompt_buttons_frame,
-            text="Reset to Default",
-            command=self._reset_to_default,
-        )
-        btn_reset.pack(side=tk.LEFT)
+            dnd_hint = ttk.Label(
+                project_frame,
+                text="✓ Drag & Drop Enabled",
+                foreground="green" if TKDND_AVAILABLE else "gray",
+            )
+            dnd_hint.pack(side=tk.LEFT, padx=(5, 0))
 
-        settings_frame = ttk.Frame(notebook, padding="5")
-        notebook.add(settings_frame, text="Settings")
+            buttons_frame = ttk.Frame(action_frame)
+            buttons_frame.pack(side=tk.RIGHT, padx=(10, 0))
 
-        exclusion_label = ttk.Label(
-            settings_frame, text="File Exclusion Settings:", style="Header.TLabel"
-        )
-        exclusion_label.pack(anchor=tk.W, pady=(0, 5))
+            btn_copy = ttk.Button(
+                buttons_frame, text="Copy to Clipboard", command=self._copy_to_clipboard
+            )
+            btn_copy.pack(side=tk.LEFT, padx=(0, 5))
 
-        dir_frame = ttk.Frame(settings_frame)
-        dir_frame.pack(fill=tk.X, pady=(0, 5))
+            btn_save = ttk.Button(
+                buttons_frame, text="Save to File", command=self._save_to_file
+            )
+            btn_save.pack(side=tk.LEFT)
 
-        ttk.Label(dir_frame, text="Excluded Directories:").pack(side=tk.LEFT)
-        excluded_dirs_entry = ttk.Entry(
-            dir_frame, textvariable=self.excluded_dirs_var, width=40
-        )
-        excluded_dirs_entry.pack(side=tk.LEFT, padx=(5, 0), fill=tk.X, expand=True)
+            notebook = ttk.Notebook(main_container)
+            notebook.pack(fill=tk.BOTH, expand=True)
 
-        patterns_frame = ttk.Frame(settings_frame)
-        patterns_frame.pack(fill=tk.X, pady=(0, 10))
+            output_frame = ttk.Frame(notebook, padding="5")
+            notebook.add(output_frame, text="Output")
 
-        ttk.Label(patterns_frame, text="Excluded File Patterns:").pack(side=tk.LEFT)
-        excluded_patterns_entry = ttk.Entry(
-            patterns_frame, textvariable=self.excluded_patterns_var, width=40
-        )
-        excluded_patterns_entry.pack(side=tk.LEFT, padx=(5, 0), fill=tk.X, expand=True)
+            drop_frame = ttk.Frame(output_frame, padding="2")
+            drop_frame.pack(fill=tk.BOTH, expand=True)
 
-        ttk.Button(
-            settings_frame, text="Apply Settings", command=self._apply_settings
-        ).pack(anchor=tk.W)
+            output_label = ttk.Label(
+                drop_frame,
+                text="Generated Project Dump: (Drag & Drop folder here)",
+                style="Header.TLabel",
+            )
+            output_label.pack(anchor=tk.W, pady=(0, 5))
 
-        status_bar = ttk.Label(
-            self, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W
-        )
-        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+            self.text_area = ScrolledText(
+                drop_frame, wrap=tk.WORD, font=("Consolas", 10)
+            )
+            self.text_area.pack(expand=True, fill=tk.BOTH)
 
-    def _select_folder(self) -> None:
-        """
-        Open folder picker dialog and process the selected project.
-        """
-        folder = filedialog.askdirectory(title="Select a Project Folder")
-        if folder:
-            self.folder_path_var.set(folder)
-            self._load_project(Path(folder))
+            prompt_frame = ttk.Frame(notebook, padding="5")
+            notebook.add(prompt_frame, text="Custom Prompt")
 
-    def _on_drop_folder(self, event) -> None:
-        """
-        Handle drop events for drag-and-drop functionality.
-        """
-        folder_path = event.data.strip("{}").strip('"')
-        self.status_var.set(f"Folder dropped: {folder_path}")
-        src = Path(folder_path)
-        if not src.is_dir():
-            self.status_var.set("Dropped item is not a directory")
+            prompt_label = ttk.Label(
+                prompt_frame, text="Enter your custom AI prompt:", style="Header.TLabel"
+            )
+            prompt_label.pack(anchor=tk.W, pady=(0, 5))
 
-            messagebox.showerror("Error", "Please drop a folder")
-            return
-        self.folder_path_var.set(str(src))
-        self._load_project(src)
+            self.custom_prompt_text = ScrolledText(
+                prompt_frame, height=10, font=("Consolas", 10)
+            )
+            self.custom_prompt_text.insert(tk.END, self.custom_prompt)
+            self.custom_prompt_text.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
 
-    def _load_project(self, path: Path) -> None:
-        """
-        Process and display the selected project.
-        """
-        self.text_area.delete("1.0", tk.END)
-        self.text_area.insert(
-            tk.END, "Loading project... This may take a moment for large projects."
-        )
-        self.update()
+            prompt_buttons_frame = ttk.Frame(prompt_frame)
+            prompt_buttons_frame.pack(fill=tk.X)
 
-        try:
-            output = self.project_dumper.process_project(path, self.custom_prompt)
-            self.text_area.delete("1.0", tk.END)
-            self.text_area.insert(tk.END, output)
-            self.generated_output = output
-            self.status_var.set(f"Project loaded: {path}")
-        except Exception as e:
-            self.status_var.set(f"Error: {e}")
-            messagebox.showerror("Error", str(e))
+            btn_save_custom = ttk.Button(
+                prompt_buttons_frame,
+                text="Save Custom Prompt",
+                command=self._save_custom_prompt,
+            )
+            btn_save_custom.pack(side=tk.LEFT, padx=(0, 5))
 
-    def _copy_to_clipboard(self) -> None:
-        """
-        Copy the generated output to the system clipboard.
-        """
-        if self.generated_output:
-            self.clipboard_clear()
-            self.clipboard_append(self.generated_output)
-            self.update()
-            self.status_var.set("Output copied to clipboard")
-            messagebox.showinfo("Copied", "Output copied to clipboard.")
-        else:
-            self.status_var.set("No output to copy")
-            messagebox.showwarning(
-                "No Output", "No project output has been generated yet."
+            btn_reset = ttk.Button(
+                prompt_buttons_frame,
+                text="Reset to Default",
+                command=self._reset_to_default,
             )
+            btn_reset.pack(side=tk.LEFT)
 
-    def _save_to_file(self) -> None:
-        """
-        Save the generated output to a text file.
-        """
-        if self.generated_output:
-            out_path = filedialog.asksaveasfilename(
-                title="Save Output File",
-                defaultextension=".txt",
-                filetypes=[("Text files", "*.txt")],
+            settings_frame = ttk.Frame(notebook, padding="5")
+            notebook.add(settings_frame, text="Settings")
+
+            exclusion_label = ttk.Label(
+                settings_frame, text="File Exclusion Settings:", style="Header.TLabel"
             )
-            if out_path:
-                Path(out_path).write_text(self.generated_output, encoding="utf-8")
-                self.status_var.set(f"Output saved to {out_path}")
-                messagebox.showinfo("Saved", f"Output saved to {out_path}")
-        else:
-            self.status_var.set("No output to save")
-            messagebox.showwarning(
-                "No Output", "No project output has been generated yet."
+            exclusion_label.pack(anchor=tk.W, pady=(0, 5))
+
+            dir_frame = ttk.Frame(settings_frame)
+            dir_frame.pack(fill=tk.X, pady=(0, 5))
+
+            ttk.Label(dir_frame, text="Excluded Directories:").pack(side=tk.LEFT)
+            excluded_dirs_entry = ttk.Entry(
+                dir_frame, textvariable=self.excluded_dirs_var, width=40
             )
+            excluded_dirs_entry.pack(side=tk.LEFT, padx=(5, 0), fill=tk.X, expand=True)
 
-    def _save_custom_prompt(self) -> None:
-        """
-        Save the custom prompt entered by the user.
-        """
-        custom_prompt = self.custom_prompt_text.get("1.0", tk.END).strip()
-        if custom_prompt:
-            self.custom_prompt = custom_prompt
-            self.prompt_manager.save_custom_prompt(custom_prompt)
-            self.status_var.set("Custom prompt saved")
-            messagebox.showinfo(
-                "Custom Prompt Saved", "Custom prompt saved successfully!"
+            patterns_frame = ttk.Frame(settings_frame)
+            patterns_frame.pack(fill=tk.X, pady=(0, 10))
+
+            ttk.Label(patterns_frame, text="Excluded File Patterns:").pack(side=tk.LEFT)
+            excluded_patterns_entry = ttk.Entry(
+                patterns_frame, textvariable=self.excluded_patterns_var, width=40
             )
-        else:
-            messagebox.showwarning(
-                "Invalid Input", "Please enter a valid custom prompt."
+            excluded_patterns_entry.pack(
+                side=tk.LEFT, padx=(5, 0), fill=tk.X, expand=True
             )
 
-    def _reset_to_default(self) -> None:
-        """
-        Reset the prompt to the default value.
-        """
-        self.custom_prompt = DEFAULT_PROMPT
-        self.custom_prompt_text.delete("1.0", tk.END)
-        self.custom_prompt_text.insert(tk.END, self.custom_prompt)
-        self.prompt_manager.save_custom_prompt(DEFAULT_PROMPT)
-        self.status_var.set("Prompt reset to default")
-        messagebox.showinfo("Prompt Reset", "Prompt reset to default.")
+            ttk.Button(
+                settings_frame, text="Apply Settings", command=self._apply_settings
+            ).pack(anchor=tk.W)
 
-    def _apply_settings(self) -> None:
-        """
-        Apply the settings from the settings tab.
-        """
-        excluded_dirs = {
-            d.strip() for d in self.excluded_dirs_var.get().split(",") if d.strip()
-        }
-        excluded_patterns = {
-            p.strip() for p in self.excluded_patterns_var.get().split(",") if p.strip()
-        }
-        self.project_dumper = ProjectDumper(excluded_dirs, excluded_patterns)
-        self.status_var.set("Settings applied")
-        messagebox.showinfo("Settings", "Settings have been applied.")
+            status_bar = ttk.Label(
+                self, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W
+            )
+            status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+
+        def _select_folder(self) -> None:
+            """
+            Open folder picker dialog and process the selected project.
+            """
+            folder = filedialog.askdirectory(title="Select a Project Folder")
+            if folder:
+                self.folder_path_var.set(folder)
+                self._load_project(Path(folder))
+
+        def _on_drop_folder(self, event) -> None:
+            """
+            Handle drop events for drag-and-drop functionality.
+            """
+            folder_path = event.data.strip("{}").strip('"')
+            self.status_var.set(f"Folder dropped: {folder_path}")
+            src = Path(folder_path)
+            if not src.is_dir():
+                self.status_var.set("Dropped item is not a directory")
+
+                messagebox.showerror("Error", "Please drop a folder")
+                return
+            self.folder_path_var.set(str(src))
+            self._load_project(src)
+
+        def _load_project(self, path: Path) -> None:
+            """
+            Process and display the selected project.
+            """
+            self.text_area.delete("1.0", tk.END)
+            self.text_area.insert(
+                tk.END, "Loading project... This may take a moment for large projects."
+            )
+            self.update()
+
+            try:
+                chunks = self.project_dumper.iter_project_chunks(
+                    path, self.custom_prompt
+                )
+                output: List[str] = []
+                for i, chunk in enumerate(chunks):
+                    if i == 0:
+                        self.text_area.delete("1.0", tk.END)
+                    else:
+                        self.text_area.insert(tk.END, "\n\n")
+                    self.text_area.insert(tk.END, chunk)
+                    output.append(chunk)
+                    if i % 50 == 0:
+                        self.update_idletasks()
+                self.generated_output = "\n\n".join(output)
+                self.status_var.set(f"Project loaded: {path}")
+            except Exception as e:
+                self.status_var.set(f"Error: {e}")
+                messagebox.showerror("Error", str(e))
+
+        def _copy_to_clipboard(self) -> None:
+            """
+            Copy the generated output to the system clipboard.
+            """
+            if self.generated_output:
+                self.clipboard_clear()
+                self.clipboard_append(self.generated_output)
+                self.update()
+                self.status_var.set("Output copied to clipboard")
+                messagebox.showinfo("Copied", "Output copied to clipboard.")
+            else:
+                self.status_var.set("No output to copy")
+                messagebox.showwarning(
+                    "No Output", "No project output has been generated yet."
+                )
+
+        def _save_to_file(self) -> None:
+            """
+            Save the generated output to a text file.
+            """
+            if self.generated_output:
+                out_path = filedialog.asksaveasfilename(
+                    title="Save Output File",
+                    defaultextension=".txt",
+                    filetypes=[("Text files", "*.txt")],
+                )
+                if out_path:
+                    Path(out_path).write_text(self.generated_output, encoding="utf-8")
+                    self.status_var.set(f"Output saved to {out_path}")
+                    messagebox.showinfo("Saved", f"Output saved to {out_path}")
+            else:
+                self.status_var.set("No output to save")
+                messagebox.showwarning(
+                    "No Output", "No project output has been generated yet."
+                )
+
+        def _save_custom_prompt(self) -> None:
+            """
+            Save the custom prompt entered by the user.
+            """
+            custom_prompt = self.custom_prompt_text.get("1.0", tk.END).strip()
+            if custom_prompt:
+                self.custom_prompt = custom_prompt
+                self.prompt_manager.save_custom_prompt(custom_prompt)
+                self.status_var.set("Custom prompt saved")
+                messagebox.showinfo(
+                    "Custom Prompt Saved", "Custom prompt saved successfully!"
+                )
+            else:
+                messagebox.showwarning(
+                    "Invalid Input", "Please enter a valid custom prompt."
+                )
+
+        def _reset_to_default(self) -> None:
+            """
+            Reset the prompt to the default value.
+            """
+            self.custom_prompt = DEFAULT_PROMPT
+            self.custom_prompt_text.delete("1.0", tk.END)
+            self.custom_prompt_text.insert(tk.END, self.custom_prompt)
+            self.prompt_manager.save_custom_prompt(DEFAULT_PROMPT)
+            self.status_var.set("Prompt reset to default")
+            messagebox.showinfo("Prompt Reset", "Prompt reset to default.")
+
+        def _apply_settings(self) -> None:
+            """
+            Apply the settings from the settings tab.
+            """
+            excluded_dirs = {
+                d.strip() for d in self.excluded_dirs_var.get().split(",") if d.strip()
+            }
+            excluded_patterns = {
+                p.strip()
+                for p in self.excluded_patterns_var.get().split(",")
+                if p.strip()
+            }
+            self.project_dumper = ProjectDumper(excluded_dirs, excluded_patterns)
+            self.status_var.set("Settings applied")
+            messagebox.showinfo("Settings", "Settings have been applied.")
+
+    return App
 
 
 def run_cli_mode(args: argparse.Namespace) -> None:
@@ -590,10 +945,9 @@ def run_cli_mode(args: argparse.Namespace) -> None:
         if prompt_path.is_file():
             try:
                 if prompt_path.suffix.lower() == ".json":
-                    with open(prompt_path, "r", encoding="utf-8") as f:
-                        custom_prompt = json.load(f).get(
-                            "custom_prompt", DEFAULT_PROMPT
-                        )
+                    custom_prompt = _json_loads(prompt_path.read_bytes()).get(
+                        "custom_prompt", DEFAULT_PROMPT
+                    )
                 else:
                     custom_prompt = prompt_path.read_text(encoding="utf-8").strip()
             except Exception as e:
@@ -605,29 +959,44 @@ def run_cli_mode(args: argparse.Namespace) -> None:
                 file=sys.stderr,
             )
 
+    out_file = sys.stdout
+    if args.output:
+        try:
+            out_file = open(args.output, "w", encoding="utf-8")
+        except Exception as e:
+            print(f"Error writing to output file: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    # Stream the dump chunk by chunk instead of building it in memory first.
     project_dumper = ProjectDumper()
     try:
-        output = project_dumper.process_project(project_path, custom_prompt)
-
-        if args.output:
-            try:
-                Path(args.output).write_text(output, encoding="utf-8")
-                print(f"Project dump saved to {args.output}")
-            except Exception as e:
-                print(f"Error writing to output file: {e}", file=sys.stderr)
-                sys.exit(1)
-        else:
-            print(output)
-
+        chunks = project_dumper.iter_project_chunks(project_path, custom_prompt)
+        for i, chunk in enumerate(chunks):
+            if i:
+                out_file.write("\n\n")
+            out_file.write(chunk)
     except Exception as e:
         print(f"Error processing project: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if out_file is not sys.stdout:
+            out_file.close()
+
+    if args.output:
+        print(f"Project dump saved to {args.output}")
+    else:
+        print()
 
 
 def run_gui_mode(args: argparse.Namespace) -> None:
     """
     Run the tool in graphical user interface mode.
     """
+    App = _build_app_class()
+    if not TKDND_AVAILABLE:
+        print("TkinterDnD2 is not installed. Drag and drop functionality is disabled.")
+        print("To enable it, install it using: pip install tkinterdnd2")
+
     app = App()
 
     if args.project_dir:
@@ -648,10 +1017,9 @@ def run_gui_mode(args: argparse.Namespace) -> None:
             # prompt_manager = PromptManager()
             try:
                 if prompt_path.suffix.lower() == ".json":
-                    with open(prompt_path, "r", encoding="utf-8") as f:
-                        custom_prompt = json.load(f).get(
-                            "custom_prompt", DEFAULT_PROMPT
-                        )
+                    custom_prompt = _json_loads(prompt_path.read_bytes()).get(
+                        "custom_prompt", DEFAULT_PROMPT
+                    )
                 else:
                     custom_prompt = prompt_path.read_text(encoding="utf-8").strip()
 
@@ -708,4 +1076,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False):  # PyInstaller build: worker processes
+        import multiprocessing
+
+        multiprocessing.freeze_support()
     main()
@@ -0,0 +1,139 @@
+import concurrent.futures
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import project_dump  # noqa: E402
+from project_dump import ProjectDumper  # noqa: E402
+
+
+def test_gitignore_posix_character_class(tmp_path: Path) -> None:
+    (tmp_path / ".gitignore").write_text("[[:space:]]*\n", encoding="utf-8")
+    (tmp_path / " spaced.txt").write_text("ignored", encoding="utf-8")
+    (tmp_path / "kept.txt").write_text("kept", encoding="utf-8")
+
+    output = ProjectDumper().process_project(tmp_path, "prompt")
+
+    assert "File: kept.txt" in output
+    assert "spaced.txt" not in output
+
+
+def _dump_gitignored(tmp_path: Path, rules: str, files: List[str]) -> str:
+    (tmp_path / ".gitignore").write_text(rules, encoding="utf-8")
+    for name in files:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name, encoding="utf-8")
+    return ProjectDumper().process_project(tmp_path, "prompt")
+
+
+def test_malformed_gitignore_rules_are_skipped() -> None:
+    dumper = ProjectDumper()
+    dumper._compile_gitignore(["x[!]", "*.bak", "[z-a]", "[\\]"])
+
+    assert dumper._gitignore_re is not None
+    assert dumper._gitignore_re.match("notes.bak")
+    assert dumper._gitignore_re.match("src/notes.bak")
+    assert not dumper._gitignore_re.match("notes.txt")
+
+
+def test_gitignore_leading_slash_anchors_to_root(tmp_path: Path) -> None:
+    output = _dump_gitignored(tmp_path, "/dist\n", ["dist/out.js", "src/dist/in.js"])
+
+    assert "File: dist/out.js" not in output
+    assert "File: src/dist/in.js" in output
+
+
+def test_gitignore_trailing_slash_matches_directories_only(tmp_path: Path) -> None:
+    output = _dump_gitignored(tmp_path, "build/\n", ["build/a.txt", "src/build"])
+
+    assert "File: build/a.txt" not in output
+    assert "File: src/build" in output
+
+
+def test_gitignore_double_star_prefix_matches_any_depth(tmp_path: Path) -> None:
+    output = _dump_gitignored(
+        tmp_path, "**/cache.txt\n", ["cache.txt", "a/b/cache.txt", "a/keep.txt"]
+    )
+
+    assert "cache.txt" not in output
+    assert "File: a/keep.txt" in output
+
+
+def test_gitignore_double_star_between_directories(tmp_path: Path) -> None:
+    output = _dump_gitignored(
+        tmp_path, "a/**/b.txt\n", ["a/b.txt", "a/x/y/b.txt", "c/a/b.txt"]
+    )
+
+    assert "File: a/b.txt" not in output
+    assert "File: a/x/y/b.txt" not in output
+    assert "File: c/a/b.txt" in output
+
+
+def test_gitignore_last_matching_rule_wins(tmp_path: Path) -> None:
+    output = _dump_gitignored(
+        tmp_path,
+        "*.txt\n!keep.txt\nkeep.txt\n!*/keep.txt\n",
+        ["keep.txt", "d/keep.txt"],
+    )
+
+    assert "File: keep.txt" not in output
+    assert "File: d/keep.txt" in output
+
+
+def test_gitignore_excluded_directory_is_pruned(tmp_path: Path) -> None:
+    output = _dump_gitignored(
+        tmp_path, "build\n!build/keep.txt\n", ["build/keep.txt", "main.py"]
+    )
+
+    # git cannot re-include a file inside an excluded directory.
+    assert "build" not in output
+    assert "File: main.py" in output
+
+
+def test_process_pool_output_matches_threads(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for i in range(7):
+        sub = tmp_path / f"pkg{i % 3}"
+        sub.mkdir(exist_ok=True)
+        (sub / f"mod{i}.py").write_text(f"value = {i}\r\n", encoding="utf-8")
+    (tmp_path / "blob.dat").write_bytes(b"\0\1\2" * 100)
+    (tmp_path / "latin1.txt").write_bytes(b"caf\xe9\n")
+
+    expected = ProjectDumper().process_project(tmp_path, "prompt")
+
+    pools = []
+
+    class RecordingPool(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self) -> None:
+            super().__init__(max_workers=2)
+            pools.append(self)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", RecordingPool)
+    monkeypatch.setattr(project_dump, "PROCESS_POOL_MIN_FILES", 1)
+    monkeypatch.setattr(project_dump, "PROCESS_BATCH_SIZE", 2)
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+    assert ProjectDumper().process_project(tmp_path, "prompt") == expected
+    assert pools
+
+
+def test_symlinked_directory_is_listed_but_not_descended(tmp_path: Path) -> None:
+    (tmp_path / "real").mkdir()
+    (tmp_path / "real" / "inner.txt").write_text("inner", encoding="utf-8")
+    try:
+        (tmp_path / "real" / "loop").symlink_to(tmp_path, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks are not available")
+
+    output = ProjectDumper().process_project(tmp_path, "prompt")
+
+    assert "loop" in output
+    assert "File: real/inner.txt" in output
+    assert "real/loop/" not in output